@@ -528,6 +528,12 @@ class IgnisApp(Gtk.Application, IgnisGObject):
         """
         Quit Ignis.
         """
+        from ignis.services.notifications import NotificationService
+
+        # don't lose the notifications received right before quitting
+        if NotificationService._instance is not None:
+            NotificationService._instance._shutdown()
+
         super().quit()
         logger.info("Quitting.")
 
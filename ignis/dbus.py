@@ -1,3 +1,7 @@
+import os
+import sys
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 from gi.repository import Gio, GLib, GObject  # type: ignore
 from typing import Any
 from collections.abc import Callable
@@ -8,6 +12,40 @@ from typing import Literal
 
 BUS_TYPE = {"session": Gio.BusType.SESSION, "system": Gio.BusType.SYSTEM}
 
+_PROPERTIES_INTERFACE = "org.freedesktop.DBus.Properties"
+
+_POOL: ThreadPoolExecutor | None = None
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    # shared by all DBusService instances, created on first use
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="ignis-dbus"
+        )
+    return _POOL
+
+
+def _is_cheap_signature(signature: str) -> bool:
+    # arrays and variants can hold an arbitrary amount of data (e.g., pixbufs),
+    # anything else can be unpacked in the main thread without noticeable blocking
+    return "a" not in signature and "v" not in signature
+
+
+def _invoke_and_return(
+    invocation: Gio.DBusMethodInvocation, func: Callable, unpacked_params: tuple
+) -> None:
+    result = func(invocation, *unpacked_params)
+    invocation.return_value(result)
+
+
+def _invoke_when_unpacked(
+    invocation: Gio.DBusMethodInvocation, func: Callable, future: Future
+) -> None:
+    # called in the worker thread, so go back to the main loop
+    GLib.idle_add(_invoke_and_return, invocation, func, future.result())
+
 
 class DBusService(IgnisGObject):
     """
@@ -49,6 +87,14 @@ class DBusService(IgnisGObject):
         self._methods: dict[str, Callable] = {}
         self._properties: dict[str, Callable] = {}
 
+        # the in-args signature of a method never changes, so decide once per method
+        self._cheap_methods: dict[str, bool] = {
+            sys.intern(m.name): _is_cheap_signature(
+                "(" + "".join(arg.signature for arg in m.in_args or []) + ")"
+            )
+            for m in info.methods
+        }
+
         self._id = Gio.bus_own_name(
             Gio.BusType.SESSION,
             name,
@@ -160,20 +206,22 @@ class DBusService(IgnisGObject):
         params: GLib.Variant,
         invocation: Gio.DBusMethodInvocation,
     ) -> None:
-        def callback(func: Callable, unpacked_params) -> None:
-            result = func(invocation, *unpacked_params)
-            invocation.return_value(result)
+        method_name = sys.intern(method_name)
+        try:
+            func = self._methods[method_name]
+        except KeyError:
+            raise DBusMethodNotFoundError(method_name) from None
 
-        func = self._methods.get(method_name, None)
-        if not func:
-            raise DBusMethodNotFoundError(method_name)
+        if self._cheap_methods[method_name]:
+            _invoke_and_return(invocation, func, params.unpack())
+            return
 
         # params can contain pixbuf, very large amount of data
         # and unpacking may take some time and block the main thread
-        # so we unpack in another thread, and call DBus method when unpacking is finished
-        Utils.ThreadTask(
-            target=params.unpack, callback=lambda result: callback(func, result)
-        ).run()
+        # so we unpack in a worker thread, and call DBus method in the main loop when unpacking is finished
+        _get_pool().submit(params.unpack).add_done_callback(
+            functools.partial(_invoke_when_unpacked, invocation, func)
+        )
 
     def __handle_get_property(
         self,
@@ -183,9 +231,10 @@ class DBusService(IgnisGObject):
         interface: str,
         value: str,
     ) -> GLib.Variant:
-        func = self._properties.get(value, None)
-        if not func:
-            raise DBusPropertyNotFoundError(value)
+        try:
+            func = self._properties[sys.intern(value)]
+        except KeyError:
+            raise DBusPropertyNotFoundError(value) from None
 
         return func()
 
@@ -201,7 +250,14 @@ class DBusService(IgnisGObject):
             - Must accept :class:`Gio.DBusMethodInvocation` as the first argument.
             - Must accept all other arguments typical for this method (specified by interface info).
             - Must return :class:`GLib.Variant` or ``None``, as specified by interface info.
+
+        Raises:
+            DBusMethodNotFoundError: If the interface info has no method with the given name.
         """
+        name = sys.intern(name)
+        if name not in self._cheap_methods:
+            raise DBusMethodNotFoundError(name)
+
         self._methods[name] = method
 
     def register_dbus_property(self, name: str, method: Callable) -> None:
@@ -215,7 +271,7 @@ class DBusService(IgnisGObject):
         DBus properties:
             - Must return :class:`GLib.Variant`, as specified by interface info.
         """
-        self._properties[name] = method
+        self._properties[sys.intern(name)] = method
 
     def emit_signal(
         self, signal_name: str, parameters: "GLib.Variant | None" = None
@@ -296,6 +352,8 @@ class DBusProxy(IgnisGObject):
 
         self._methods: list[str] = []
         self._properties: list[str] = []
+        # GLib.Variant is immutable, so the "Get" arguments can be reused
+        self._prop_variant_cache: dict[str, GLib.Variant] = {}
 
         self._proxy = Gio.DBusProxy.new_for_bus_sync(
             BUS_TYPE[bus_type],
@@ -307,11 +365,20 @@ class DBusProxy(IgnisGObject):
             None,
         )
 
+        # attribute name -> bound proxy method, or None for a D-Bus property
+        # methods are bound on first access
+        attr_table: dict[str, Callable | None] = {}
+
         for i in info.methods:
             self._methods.append(i.name)
 
         for i in info.properties:  # type: ignore
             self._properties.append(i.name)
+            attr_table[i.name] = None
+
+        self._attr_table = attr_table
+        self._methods_set = frozenset(self._methods)
+        self._properties_set = frozenset(self._properties)
 
     @GObject.Property
     def name(self) -> str:
@@ -405,25 +472,26 @@ class DBusProxy(IgnisGObject):
 
         Whether the ``name`` has an owner.
         """
-        dbus = DBusProxy(
-            name="org.freedesktop.DBus",
-            object_path="/org/freedesktop/DBus",
-            interface_name="org.freedesktop.DBus",
-            info=Utils.load_interface_xml("org.freedesktop.DBus"),
-            bus_type=self._bus_type,
-        )
-        return dbus.NameHasOwner("(s)", self.name)
+        return _get_dbus_daemon_proxy(self._bus_type).NameHasOwner("(s)", self.name)
 
     def __getattr__(self, name: str) -> Any:
-        if name in self.methods:
-            return getattr(self._proxy, name)
-        elif name in self.properties:
+        attrs = self.__dict__  # avoid recursion
+        try:
+            method = attrs["_attr_table"][name]
+        except KeyError:
+            if name in attrs.get("_methods_set", ()):
+                method = attrs["_attr_table"][name] = getattr(self._proxy, name)
+                return method
+
+            return super().__getattribute__(name)
+
+        if method is None:
             return self.__get_dbus_property(name)
         else:
-            return super().__getattribute__(name)
+            return method
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name in self.__dict__.get("_properties", {}):  # avoid recursion
+        if name in self.__dict__.get("_properties_set", ()):  # avoid recursion
             self.__set_dbus_property(name, value)
         else:
             return super().__setattr__(name, value)
@@ -461,17 +529,23 @@ class DBusProxy(IgnisGObject):
         """
         self.connection.signal_unsubscribe(id)
 
+    def __get_property_variant(self, property_name: str) -> GLib.Variant:
+        variant = self._prop_variant_cache.get(property_name, None)
+        if variant is None:
+            variant = self._prop_variant_cache[property_name] = GLib.Variant(
+                "(ss)",
+                (self.interface_name, property_name),
+            )
+        return variant
+
     def __get_dbus_property(self, property_name: str) -> Any:
         try:
             return self.connection.call_sync(
                 self.name,
                 self.object_path,
-                "org.freedesktop.DBus.Properties",
+                _PROPERTIES_INTERFACE,
                 "Get",
-                GLib.Variant(
-                    "(ss)",
-                    (self.interface_name, property_name),
-                ),
+                self.__get_property_variant(property_name),
                 None,
                 Gio.DBusCallFlags.NONE,
                 -1,
@@ -484,7 +558,7 @@ class DBusProxy(IgnisGObject):
         self.connection.call_sync(
             self.name,
             self.object_path,
-            "org.freedesktop.DBus.Properties",
+            _PROPERTIES_INTERFACE,
             "Set",
             GLib.Variant(
                 "(ssv)",
@@ -496,6 +570,35 @@ class DBusProxy(IgnisGObject):
             None,
         )
 
+    def get_dbus_property_async(self, property_name: str, callback: Callable) -> None:
+        """
+        Get the value of a D-Bus property without blocking the main loop.
+
+        Args:
+            property_name: The name of the property to get.
+            callback: A function to call when the value is received. It will receive the value of the property, or ``None`` if it could not be obtained.
+        """
+
+        def on_finish(connection: Gio.DBusConnection, res: Gio.AsyncResult) -> None:
+            try:
+                value = connection.call_finish(res)[0]
+            except GLib.GError:  # type: ignore
+                value = None
+            callback(value)
+
+        self.connection.call(
+            self.name,
+            self.object_path,
+            _PROPERTIES_INTERFACE,
+            "Get",
+            self.__get_property_variant(property_name),
+            None,
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
+            on_finish,
+        )
+
     def watch_name(
         self,
         on_name_appeared: Callable | None = None,
@@ -521,3 +624,20 @@ class DBusProxy(IgnisGObject):
         Unwatch name.
         """
         Gio.bus_unwatch_name(self._watcher)
+
+
+# bus type -> proxy to the message bus itself, created on first use
+_DBUS_DAEMON_PROXIES: dict[str, DBusProxy] = {}
+
+
+def _get_dbus_daemon_proxy(bus_type: Literal["session", "system"]) -> DBusProxy:
+    proxy = _DBUS_DAEMON_PROXIES.get(bus_type, None)
+    if proxy is None:
+        proxy = _DBUS_DAEMON_PROXIES[bus_type] = DBusProxy(
+            name="org.freedesktop.DBus",
+            object_path="/org/freedesktop/DBus",
+            interface_name="org.freedesktop.DBus",
+            info=Utils.load_interface_xml("org.freedesktop.DBus"),
+            bus_type=bus_type,
+        )
+    return proxy
@@ -85,19 +85,30 @@ class IgnisGObject(GObject.Object):
         Args:
             without: A property or a list of properties that will not be notified.
         """
+        names = []
         for i in self.list_properties():
             if without:
                 if i.name in without:
                     continue
-            self.notify(i.name)
+            names.append(i.name)
+
+        self.notify_list(*names)
 
     def notify_list(self, *args) -> None:
         """
         Notify list of properties.
         You can pass unlimited number of property names as arguments.
         """
-        for i in args:
-            self.notify(i)
+        # All properties are notified in one main loop iteration, as a single batch.
+        GLib.idle_add(self.__notify_batch, args)
+
+    def __notify_batch(self, property_names: tuple[str, ...]) -> None:
+        self.freeze_notify()
+        try:
+            for i in property_names:
+                super().notify(i)
+        finally:
+            self.thaw_notify()
 
     def set_property(self, property_name: str, value: Any) -> None:
         """
@@ -178,7 +189,11 @@ class IgnisGObject(GObject.Object):
         # This modified __getattribute__ method redirect all "set_" methods to set_property method to provive bindings support.
         # "get_" method redirect need to widgets that override enums, to make "get_" return strings instead of enums.
 
-        if name.startswith("set_"):
+        # Private attributes (e.g., "self._methods") are never redirected, so they skip the checks.
+
+        if name[:1] == "_":
+            pass
+        elif name.startswith("set_"):
             property_name = name.replace("set_", "")
             if self.find_property(property_name):
                 return lambda value: self.set_property(property_name, value)
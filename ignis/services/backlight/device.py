@@ -28,7 +28,7 @@ class BacklightDevice(IgnisGObject):
         with open(self._PATH_TO_MAX_BRIGHTNESS) as backlight_file:
             self._max_brightness = int(backlight_file.read().strip())
 
-        Utils.FileMonitor(
+        self.__monitor = Utils.FileMonitor(
             path=self._PATH_TO_BRIGHTNESS,
             callback=lambda x, path, event_type: self.__sync_brightness()
             if event_type != "changed"  # "changed" event is called multiple times
@@ -43,8 +43,18 @@ class BacklightDevice(IgnisGObject):
             bus_type="system",
         )
 
+        self.connect("removed", lambda x: self.__monitor.cancel())
+
         self.__sync_brightness()
 
+    @GObject.Signal
+    def removed(self):
+        """
+        - Signal
+
+        Emitted when the device has been removed.
+        """
+
     def __sync_brightness(self) -> None:
         with open(self._PATH_TO_BRIGHTNESS) as backlight_file:
             self._brightness = int(backlight_file.read().strip())
@@ -32,11 +32,15 @@ class BacklightService(BaseService):
         super().__init__()
 
         self._devices: list[BacklightDevice] = []
+        self._available: bool = False
+
+        # udev can create/delete several entries in a row, resync once after the burst
+        self.__resync_task = Utils.DebounceTask(ms=50, target=self.__sync_devices)
 
         # FIXME: not working
         Utils.FileMonitor(
             path=SYS_BACKLIGHT,
-            callback=lambda x, path, event_type: self.__sync_devices()
+            callback=lambda x, path, event_type: self.__resync_task.run()
             if event_type == "deleted" or event_type == "created"
             else None,
         )
@@ -44,19 +48,33 @@ class BacklightService(BaseService):
         self.__sync_devices()
 
     def __sync_devices(self) -> None:
-        self._devices = []
+        with os.scandir(SYS_BACKLIGHT) as entries:
+            names = [entry.name for entry in entries if not entry.name.startswith(".")]
+
+        # keep devices that are still present, so only added ones have to be initialized
+        present = set(names)
+        current: dict[str, BacklightDevice] = {}
+        for device in self._devices:
+            if device.device_name in present:
+                current[device.device_name] = device
+            else:
+                device.emit("removed")
 
-        for device_name in os.listdir(SYS_BACKLIGHT):
-            self._devices.append(BacklightDevice(device_name))
+        for name in names:
+            if name not in current:
+                device = BacklightDevice(name)
+                device.connect("notify::brightness", self.__on_device_brightness)
+                current[name] = device
 
-        if len(self._devices) > 0:
-            self._devices[0].connect(
-                "notify::brightness",
-                lambda x, y: self.notify("brightness"),
-            )
+        self._devices = list(current.values())
+        self._available = len(self._devices) > 0
 
         self.notify_all()
 
+    def __on_device_brightness(self, device: BacklightDevice, *args) -> None:
+        if self._devices and device is self._devices[0]:
+            self.notify("brightness")
+
     @GObject.Property
     def available(self) -> bool:
         """
@@ -64,7 +82,7 @@ class BacklightService(BaseService):
 
         Whether there are controllable backlight devices.
         """
-        return len(self._devices) > 0
+        return self._available
 
     @GObject.Property
     def devices(self) -> list[BacklightDevice]:
@@ -83,13 +101,14 @@ class BacklightService(BaseService):
         The current brightness of the first backlight device in the list, ``-1`` if there are no backlight devices.
         Setting this property will set provided brightness on ALL backlight devices.
         """
-        if len(self._devices) > 0:
+        if self._available:
             return self._devices[0].brightness
         else:
             return -1
 
     @brightness.setter
     def brightness(self, value: int) -> None:
+        # each device sends SetBrightness asynchronously, so the writes already run concurrently
         for device in self._devices:
             device.brightness = value
 
@@ -100,7 +119,7 @@ class BacklightService(BaseService):
 
         The maximum brightness allowed by the first backlight device in the list, ``-1`` if there are no backlight devices.
         """
-        if len(self._devices) > 0:
+        if self._available:
             return self._devices[0].max_brightness
         else:
             return -1
@@ -4,7 +4,7 @@ from .service import NotificationService
 from .constants import (
     NOTIFICATIONS_CACHE_DIR,
     NOTIFICATIONS_CACHE_FILE,
-    NOTIFICATIONS_EMPTY_CACHE_FILE,
+    NOTIFICATIONS_META_FILE,
     NOTIFICATIONS_IMAGE_DATA,
 )
 
@@ -14,6 +14,6 @@ __all__ = [
     "NotificationService",
     "NOTIFICATIONS_CACHE_DIR",
     "NOTIFICATIONS_CACHE_FILE",
-    "NOTIFICATIONS_EMPTY_CACHE_FILE",
+    "NOTIFICATIONS_META_FILE",
     "NOTIFICATIONS_IMAGE_DATA",
 ]
@@ -1,3 +1,4 @@
+import sys
 from ignis.dbus import DBusService
 from gi.repository import GLib, GObject  # type: ignore
 from ignis.gobject import IgnisGObject
@@ -12,8 +13,8 @@ class NotificationAction(IgnisGObject):
         super().__init__()
         self.__dbus = dbus
         self.__notification = notification
-        self._id = id
-        self._label = label
+        self._id = sys.intern(id)
+        self._label = sys.intern(label)
 
     @GObject.Property
     def id(self) -> str:
@@ -1,6 +1,6 @@
+import sys
 from ignis.dbus import DBusService
 from gi.repository import GObject  # type: ignore
-from ignis.utils import Utils
 from ignis.gobject import IgnisGObject
 from .action import NotificationAction
 
@@ -29,7 +29,8 @@ class Notification(IgnisGObject):
 
         self.__dbus = dbus
         self._id = id
-        self._app_name = app_name
+        # the same apps send many notifications, so share identical strings between them
+        self._app_name = sys.intern(app_name)
         self._icon = icon
         self._summary = summary
         self._body = body
@@ -37,17 +38,24 @@ class Notification(IgnisGObject):
         self._time = time
         self._urgency = urgency
         self._popup = popup
+        # actions come as a flat list: [id1, label1, id2, label2, ...]
         self._actions = [
-            NotificationAction(
-                id=str(actions[i]),
-                label=str(actions[i + 1]),
-                dbus=self.__dbus,
-                notification=self,
-            )
-            for i in range(0, len(actions), 2)
+            NotificationAction(self.__dbus, self, str(id), str(label))
+            for id, label in zip(actions[0::2], actions[1::2], strict=False)
         ]
 
-        Utils.Timeout(timeout, self.dismiss)
+        # the notification doesn't change after creation, so the dictionary is built only once
+        self._json = {
+            "id": self._id,
+            "app_name": self._app_name,
+            "icon": self._icon,
+            "summary": self._summary,
+            "body": self._body,
+            "actions": [j for i in self._actions for j in (i.id, i.label)],
+            "timeout": self._timeout,
+            "time": self._time,
+            "urgency": self._urgency,
+        }
 
     @GObject.Signal
     def closed(self):
@@ -169,17 +177,7 @@ class Notification(IgnisGObject):
 
         The notification data in dictionary format.
         """
-        return {
-            "id": self._id,
-            "app_name": self._app_name,
-            "icon": self._icon,
-            "summary": self._summary,
-            "body": self._body,
-            "actions": [j for i in self._actions for j in (i.id, i.label)],
-            "timeout": self._timeout,
-            "time": self._time,
-            "urgency": self._urgency,
-        }
+        return self._json
 
     def close(self) -> None:
         """
@@ -1,21 +1,66 @@
 import os
-import json
+import sys
+import time
+import heapq
+import itertools
+from collections.abc import Callable
+from typing import Any
+from concurrent.futures import ThreadPoolExecutor
 from ignis.dbus import DBusService, DBusProxy
 from gi.repository import GLib, GObject, GdkPixbuf  # type: ignore
 from ignis.utils import Utils
 from loguru import logger
-from datetime import datetime
 from ignis.base_service import BaseService
 from .notification import Notification
+from .util import (
+    json_dumps,
+    json_loads,
+    append_to_file,
+    replace_file,
+    log_write_error,
+)
 from .constants import (
     NOTIFICATIONS_CACHE_DIR,
     NOTIFICATIONS_CACHE_FILE,
-    NOTIFICATIONS_EMPTY_CACHE_FILE,
+    NOTIFICATIONS_META_FILE,
+    NOTIFICATIONS_LEGACY_CACHE_FILE,
     NOTIFICATIONS_IMAGE_DATA,
 )
 from ignis.exceptions import AnotherNotificationDaemonRunningError
 from ignis.options import options
 
+# the keys of a saved notification, the same as the arguments of Notification
+_RECORD_KEYS = frozenset(
+    (
+        "id",
+        "app_name",
+        "icon",
+        "summary",
+        "body",
+        "actions",
+        "timeout",
+        "time",
+        "urgency",
+    )
+)
+
+
+def _is_valid_record(record: Any) -> bool:
+    if not isinstance(record, dict):
+        return False
+    if "closed" in record:
+        return record.keys() == {"closed"} and isinstance(record["closed"], int)
+    return (
+        record.keys() == _RECORD_KEYS
+        and isinstance(record["id"], int)
+        and isinstance(record["app_name"], str)
+        and isinstance(record["icon"], (str, type(None)))
+        and isinstance(record["summary"], str)
+        and isinstance(record["body"], str)
+        and isinstance(record["time"], (int, float))
+        and isinstance(record["actions"], list)
+    )
+
 
 class NotificationService(BaseService):
     """
@@ -24,6 +69,11 @@ class NotificationService(BaseService):
 
     There are options available for this service: :class:`~ignis.options.Options.Notifications`.
 
+    The notification history is saved to ``NOTIFICATIONS_CACHE_FILE`` (``notifications.jsonl``) in the JSON Lines format:
+    each line is either a notification in the format of :attr:`~ignis.services.notifications.Notification.json`, or ``{"closed": id}`` marking that notification as closed.
+    The last used ID is saved to ``NOTIFICATIONS_META_FILE`` (``meta.json``).
+    The old ``notifications.json`` file is no longer written; it is imported once if the new file doesn't exist.
+
     Raises:
         AnotherNotificationDaemonRunningError: If another notification daemon is already running.
 
@@ -62,6 +112,35 @@ class NotificationService(BaseService):
         self._id: int = 0
         self._notifications: dict[int, Notification] = {}
         self._popups: dict[int, Notification] = {}
+        # notifications restored from the cache, created only when they are requested
+        self._history: dict[int, dict] = {}
+        # ID -> the task saving the image of a notification, which is announced once the image exists
+        self._encoding: dict[int, Utils.ThreadTask] = {}
+
+        # all popups share one timeout, scheduled for the one that expires first
+        # (deadline in ms, tie-breaker, popup)
+        self._dismiss_queue: list[tuple[int, int, Notification]] = []
+        self._dismiss_counter = itertools.count()
+        self._dismiss_source: int = 0
+        self._sync_source: int = 0
+        self._batch_pending: bool = False
+
+        # the cache is an append-only log, compacted once enough of it is stale
+        self._pending_lines: list[str] = []
+        # notification ID -> its serialized line, reused on compaction
+        self._lines: dict[int, str] = {}
+        # lines of non-critical popups, saved only if they outlive the popup
+        self._deferred_lines: dict[int, str] = {}
+        self._log_lines: int = 0
+        self._stale_lines: int = 0
+        # the log doesn't end with a newline (e.g., after a crash), so it must be rewritten before appending
+        self._broken_tail: bool = False
+        # the last ID written to the meta file, so IDs aren't reused after a restart
+        self._saved_id: int = 0
+        # a single writer keeps the writes in order without blocking the main loop
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ignis-notifications"
+        )
 
         os.makedirs(NOTIFICATIONS_CACHE_DIR, exist_ok=True)
         os.makedirs(NOTIFICATIONS_IMAGE_DATA, exist_ok=True)
@@ -106,6 +185,15 @@ class NotificationService(BaseService):
             notification (:class:`~ignis.services.notifications.Notification`): The instance of the notification.
         """
 
+    @GObject.Signal
+    def batch_done(self):
+        """
+        - Signal
+
+        Emitted once after a burst of new notifications, after all of their ``notified`` and ``new_popup`` signals.
+        Connect to it to update the UI once per burst instead of once per notification.
+        """
+
     @GObject.Property
     def notifications(self) -> list[Notification]:
         """
@@ -113,6 +201,7 @@ class NotificationService(BaseService):
 
         A list of all notifications.
         """
+        self.__restore_history()
         return list(self._notifications.values())
 
     @GObject.Property
@@ -136,6 +225,11 @@ class NotificationService(BaseService):
         )
 
     def __CloseNotification(self, invocation, id: int) -> None:
+        if self._encoding.pop(id, None):
+            # closed before it was announced, so it's enough to just not announce it
+            self.__dbus.emit_signal("NotificationClosed", GLib.Variant("(uu)", (id, 2)))
+            return
+
         notification = self.get_notification(id)
         if notification:
             notification.close()
@@ -150,6 +244,8 @@ class NotificationService(BaseService):
         Returns:
             :class:`~ignis.services.notifications.Notification` or ``None``
         """
+        if id in self._history:
+            self.__restore_history()
         return self._notifications.get(id, None)
 
     def __Notify(
@@ -178,12 +274,18 @@ class NotificationService(BaseService):
 
         if replaces_id == 0:
             _id = self._id = self._id + 1
+            # saved even if the notification itself is not, see __sync()
+            self.__schedule_sync()
             _init(_id)
 
         else:
             _id = replaces_id
+            task = self._encoding.pop(replaces_id, None)
             old_notification = self.get_notification(replaces_id)
-            if old_notification:
+            if task:
+                # the old image is still being saved to the same path, so wait for it
+                task.connect("finished", lambda *args: _init(_id))
+            elif old_notification:
                 old_notification.close()
                 old_notification.connect("closed", lambda x: _init(_id))
             else:
@@ -205,11 +307,11 @@ class NotificationService(BaseService):
         icon = None
 
         if isinstance(app_icon, str):
-            icon = app_icon
+            # the same apps send many notifications with the same icon
+            icon = sys.intern(app_icon)
 
         if "image-data" in hints:
             icon = f"{NOTIFICATIONS_IMAGE_DATA}/{_id}"
-            self.__save_pixbuf(hints["image-data"], icon)
 
         notification = Notification(
             dbus=self.__dbus,
@@ -221,26 +323,116 @@ class NotificationService(BaseService):
             actions=actions,
             urgency=hints.get("urgency", 1),
             timeout=options.notifications.popup_timeout if timeout == -1 else timeout,
-            time=datetime.now().timestamp(),
+            time=time.time(),
             popup=not options.notifications.dnd,
         )
 
-        if len(self.popups) >= options.notifications.max_popups_count:
+        if "image-data" in hints:
+            # PNG encoding is CPU-heavy, so save the image in another thread
+            # and show the notification once its icon exists
+            task = Utils.ThreadTask(
+                target=lambda: self.__save_image(
+                    hints["image-data"], notification.icon
+                ),
+                callback=lambda result: self.__on_image_saved(notification, task),
+            )
+            # registered right away, so it can be closed or replaced while the image is being saved
+            self._encoding[_id] = task
+            task.run()
+        else:
+            self.__show_notification(notification)
+
+    def __on_image_saved(
+        self, notification: Notification, task: Utils.ThreadTask
+    ) -> None:
+        # otherwise, it was closed or replaced in the meantime
+        if self._encoding.get(notification.id, None) is task:
+            del self._encoding[notification.id]
+            self.__show_notification(notification)
+
+    def __show_notification(self, notification: Notification) -> None:
+        if len(self._popups) >= options.notifications.max_popups_count:
             if not options.notifications.max_popups_count == 0:
-                self.popups[0].dismiss()
+                self.__oldest_popup().dismiss()
 
         if notification.popup:
             self._popups[notification.id] = notification
+            self.__schedule_dismiss(notification)
             self.emit("new_popup", notification)
-            self.notify("popups")
 
         self.__add_notification(notification)
-        self.__sync()
+        line = json_dumps(notification.json) + "\n"
+        if notification.popup and notification.urgency < 2:
+            self._deferred_lines[notification.id] = line
+        else:
+            self.__save_line(notification.id, line)
         self.emit("notified", notification)
-        self.notify("notifications")
+
+        if notification.popup:
+            self.notify_list("popups", "notifications")
+        else:
+            self.notify("notifications")
+
+        if not self._batch_pending:
+            self._batch_pending = True
+            # every Notify call is handled in its own idle callback,
+            # so a lower priority lets the whole burst be handled first
+            GLib.idle_add(self.__finish_batch, priority=GLib.PRIORITY_LOW)
+
+    def __finish_batch(self) -> bool:
+        self._batch_pending = False
+        self.emit("batch_done")
+        return GLib.SOURCE_REMOVE
+
+    def __schedule_dismiss(self, notification: Notification) -> None:
+        deadline = GLib.get_monotonic_time() // 1000 + notification.timeout
+        entry = (deadline, next(self._dismiss_counter), notification)
+        heapq.heappush(self._dismiss_queue, entry)
+
+        if self._dismiss_queue[0] is entry:
+            self.__reschedule_dismiss()
+
+    def __reschedule_dismiss(self) -> None:
+        if self._dismiss_source:
+            GLib.source_remove(self._dismiss_source)
+            self._dismiss_source = 0
+
+        # drop the popups dismissed before their timeout, so they aren't kept alive until it
+        if len(self._dismiss_queue) > 2 * len(self._popups):
+            self._dismiss_queue = [e for e in self._dismiss_queue if e[2].popup]
+            heapq.heapify(self._dismiss_queue)
+        while self._dismiss_queue and not self._dismiss_queue[0][2].popup:
+            heapq.heappop(self._dismiss_queue)
+
+        if self._dismiss_queue:
+            delay = self._dismiss_queue[0][0] - GLib.get_monotonic_time() // 1000
+            self._dismiss_source = GLib.timeout_add(
+                max(delay, 0), self.__dismiss_expired
+            )
+
+    def __dismiss_expired(self) -> bool:
+        self._dismiss_source = 0
+
+        now = GLib.get_monotonic_time() // 1000
+        while self._dismiss_queue and self._dismiss_queue[0][0] <= now:
+            heapq.heappop(self._dismiss_queue)[2].dismiss()
+
+        self.__reschedule_dismiss()
+        return GLib.SOURCE_REMOVE
+
+    def __oldest_popup(self) -> Notification:
+        # dicts keep insertion order, so the first popup is the oldest one
+        return next(iter(self._popups.values()))
+
+    def __save_image(self, px_args: list, save_path: str) -> None:
+        # the task must finish normally, otherwise the notification is never shown
+        try:
+            self.__save_pixbuf(px_args, save_path)
+        except Exception as e:  # e.g., malformed image-data
+            logger.warning(f"Failed to save notification image: {e}")
 
     def __save_pixbuf(self, px_args: list, save_path: str) -> None:
-        GdkPixbuf.Pixbuf.new_from_bytes(
+        pixbuf = GdkPixbuf.Pixbuf.new_from_bytes(
             width=px_args[0],
             height=px_args[1],
             has_alpha=px_args[3],
@@ -248,7 +440,41 @@ class NotificationService(BaseService):
             colorspace=GdkPixbuf.Colorspace.RGB,
             rowstride=px_args[2],
             bits_per_sample=px_args[4],
-        ).savev(save_path, "png")
+        )
+
+        try:
+            pixbuf.savev(save_path, "png")
+        except GLib.GError:  # type: ignore
+            # the directory is created on init, but it could have been removed since then
+            os.makedirs(NOTIFICATIONS_IMAGE_DATA, exist_ok=True)
+            try:
+                pixbuf.savev(save_path, "png")
+            except GLib.GError as gerror:  # type: ignore
+                # still show the notification, just without the image
+                logger.warning(f"Failed to save notification image: {gerror.message}")
+
+    def flush(self) -> None:
+        """
+        Write all pending changes of the notification history to the disk and wait until they are written.
+        Called automatically when Ignis quits or reloads.
+        """
+        # popups that are still shown would otherwise be lost
+        for id, line in self._deferred_lines.items():
+            if id in self._notifications:
+                self.__save_line(id, line)
+        self._deferred_lines.clear()
+
+        if self._sync_source:
+            GLib.source_remove(self._sync_source)
+            self.__sync()
+
+        # the writer runs the writes in order, so once this one is done, all previous ones are too
+        self._writer.submit(lambda: None).result()
+
+    def _shutdown(self) -> None:
+        # called by IgnisApp when quitting, no writes are possible after it
+        self.flush()
+        self._writer.shutdown(wait=True)
 
     def clear_all(self) -> None:
         """
@@ -261,7 +487,10 @@ class NotificationService(BaseService):
         self._notifications.pop(notification.id)
         if notification.popup:
             notification.dismiss()
-        self.__sync()
+        if self._deferred_lines.pop(notification.id, None) is None:
+            self._lines.pop(notification.id, None)
+            self.__append_log(json_dumps({"closed": notification.id}) + "\n")
+            self._stale_lines += 2  # the notification itself and the "closed" mark
 
         self.__dbus.emit_signal(
             "NotificationClosed", GLib.Variant("(uu)", (notification.id, 2))
@@ -272,33 +501,191 @@ class NotificationService(BaseService):
     def __dismiss_popup(self, notification: Notification) -> None:
         if self._popups.get(notification.id, None):
             self._popups.pop(notification.id)
+            self.__reschedule_dismiss()
             self.notify("popups")
 
-    def __sync(self) -> None:
-        data = {
-            "id": self._id,
-            "notifications": [n.json for n in self.notifications],
-        }
-        with open(NOTIFICATIONS_CACHE_FILE, "w") as file:
-            json.dump(data, file, indent=2)
+        # the popup is gone but the notification is still there, so the user may want to read it later
+        if self._notifications.get(notification.id, None) is notification:
+            line = self._deferred_lines.pop(notification.id, None)
+            if line is not None:
+                self.__save_line(notification.id, line)
+
+    def __save_line(self, id: int, line: str) -> None:
+        self._lines[id] = line
+        self.__append_log(line)
+
+    def __append_log(self, line: str) -> None:
+        self._pending_lines.append(line)
+        self._log_lines += 1
+        self.__schedule_sync()
+
+    def __schedule_sync(self) -> None:
+        # collapse a burst of changes into a single write
+        if not self._sync_source:
+            self._sync_source = GLib.timeout_add(200, self.__sync)
+
+    def __sync(self) -> bool:
+        self._sync_source = 0
+
+        if self._broken_tail or self._stale_lines * 4 > self._log_lines:
+            self.__compact()
+        elif self._pending_lines:
+            self.__write(
+                append_to_file, NOTIFICATIONS_CACHE_FILE, "".join(self._pending_lines)
+            )
+
+        if self._id != self._saved_id:
+            self.__save_id()
+
+        self._pending_lines = []
+        return GLib.SOURCE_REMOVE
+
+    def __compact(self) -> None:
+        self.__write(
+            replace_file, NOTIFICATIONS_CACHE_FILE, "".join(self._lines.values())
+        )
+        self.__save_id()
+
+        self._log_lines = len(self._lines)
+        self._stale_lines = 0
+        self._broken_tail = False
+
+    def __save_id(self) -> None:
+        self.__write(
+            replace_file, NOTIFICATIONS_META_FILE, json_dumps({"id": self._id})
+        )
+        self._saved_id = self._id
+
+    def __write(self, func: Callable, path: str, data: str) -> None:
+        self._writer.submit(func, path, data).add_done_callback(log_write_error)
 
     def __add_notification(self, notification: Notification) -> None:
-        notification.connect("closed", lambda x: self.__close_notification(x))
-        notification.connect("dismissed", lambda x: self.__dismiss_popup(x))
+        self.__connect_notification(notification)
         self._notifications[notification.id] = notification
 
+    def __connect_notification(self, notification: Notification) -> None:
+        notification.connect("closed", self.__close_notification)
+        notification.connect("dismissed", self.__dismiss_popup)
+
+    def __read_meta(self) -> int:
+        if not os.path.exists(NOTIFICATIONS_META_FILE):
+            return 0
+
+        try:
+            with open(NOTIFICATIONS_META_FILE, encoding="utf-8") as file:
+                meta = json_loads(file.read())
+        except (OSError, ValueError):
+            meta = None
+
+        if not isinstance(meta, dict) or not isinstance(meta.get("id", 0), int):
+            # the notifications are still there, the ID is restored from them and saved again
+            logger.warning("Notification history meta file is corrupted! Ignoring...")
+            return 0
+
+        self._saved_id = meta.get("id", 0)
+        return self._saved_id
+
+    def __read_log(self) -> tuple[int, list[tuple[dict, str]]]:
+        last_id = self.__read_meta()
+
+        if not os.path.exists(NOTIFICATIONS_CACHE_FILE):
+            if not os.path.exists(NOTIFICATIONS_LEGACY_CACHE_FILE):
+                return last_id, []
+
+            # history from before the cache became a log, the compaction rewrites it in the new format
+            with open(NOTIFICATIONS_LEGACY_CACHE_FILE, encoding="utf-8") as file:
+                legacy = json_loads(file.read())
+            self._stale_lines = 1  # force the compaction
+            return legacy.get("id", 0), [
+                (n, json_dumps(n) + "\n")
+                for n in legacy.get("notifications", [])
+                if _is_valid_record(n) and "closed" not in n
+            ]
+
+        records: dict[int, tuple[dict, str]] = {}
+        # read as bytes, so a character cut in half only breaks its own line
+        with open(NOTIFICATIONS_CACHE_FILE, "rb") as file:
+            for raw_line in file:
+                self._log_lines += 1
+                self._broken_tail = not raw_line.endswith(b"\n")
+                try:
+                    line = raw_line.decode("utf-8")
+                    record = json_loads(line)
+                except ValueError:
+                    # e.g., a line cut off by a crash, it's counted as stale and dropped on compaction
+                    logger.warning(
+                        "Skipping a corrupted line in the notification history"
+                    )
+                    continue
+
+                if not _is_valid_record(record):
+                    logger.warning(
+                        "Skipping an invalid record in the notification history"
+                    )
+                    continue
+
+                if "closed" in record:
+                    records.pop(record["closed"], None)
+                    last_id = max(last_id, record["closed"])
+                else:
+                    records.pop(record["id"], None)
+                    # the last line may have no newline, and it must not get joined with the next one on compaction
+                    records[record["id"]] = (record, line.rstrip("\n") + "\n")
+                    last_id = max(last_id, record["id"])
+
+        self._stale_lines = self._log_lines - len(records)
+        # popups are saved when they are dismissed, so restore the order they were received in
+        return last_id, sorted(records.values(), key=lambda r: r[0]["time"])
+
+    def __restore_history(self) -> None:
+        if not self._history:
+            return
+
+        restored: dict[int, Notification] = {}
+        for n in self._history.values():
+            notification = Notification(**n, popup=False, dbus=self.__dbus)
+            self.__connect_notification(notification)
+            restored[notification.id] = notification
+
+        # restored notifications are older, so they go first
+        self._notifications = {**restored, **self._notifications}
+        self._history.clear()
+
     def __load_notifications(self) -> None:
         try:
-            with open(NOTIFICATIONS_CACHE_FILE) as file:
-                log_file = json.load(file)
+            last_id, records = self.__read_log()
 
-            for n in log_file.get("notifications", []):
-                notification = Notification(**n, popup=False, dbus=self.__dbus)
-                self.__add_notification(notification)
+            for n, line in records:
+                self._history[n["id"]] = n
+                self._lines[n["id"]] = line
 
-            self._id = log_file.get("id", 0)
+            self._id = last_id
 
         except Exception:
-            logger.warning("Notification history file is corrupted! Cleaning...")
-            with open(NOTIFICATIONS_CACHE_FILE, "w") as file:
-                json.dump(NOTIFICATIONS_EMPTY_CACHE_FILE, file, indent=2)
+            self._history.clear()
+            self._lines.clear()
+            self._log_lines = 0
+            self._stale_lines = 0
+            self._broken_tail = False
+            self._id = self._saved_id
+            self.__move_aside_corrupted()
+
+        if (
+            self._broken_tail
+            or self._stale_lines * 4 > self._log_lines
+            or self._id != self._saved_id
+        ):
+            self.__schedule_sync()
+
+    def __move_aside_corrupted(self) -> None:
+        # keep the unreadable file instead of overwriting it, so it can still be recovered by hand
+        for path in (NOTIFICATIONS_CACHE_FILE, NOTIFICATIONS_LEGACY_CACHE_FILE):
+            if os.path.exists(path):
+                logger.warning(
+                    f"Notification history file is corrupted! Moving it to {path}.corrupted"
+                )
+                try:
+                    os.replace(path, f"{path}.corrupted")
+                except OSError as e:
+                    logger.warning(f"Failed to move the notification history file: {e}")
+                return
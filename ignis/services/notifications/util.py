@@ -0,0 +1,41 @@
+import os
+import json
+from concurrent.futures import Future
+from loguru import logger
+from typing import Any
+
+# orjson is much faster, but it is an optional dependency
+try:
+    import orjson  # type: ignore
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def json_loads(data: str) -> Any:
+        return orjson.loads(data)
+except ImportError:
+
+    def json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+    def json_loads(data: str) -> Any:
+        return json.loads(data)
+
+
+def append_to_file(path: str, data: str) -> None:
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(data)
+
+
+def replace_file(path: str, data: str) -> None:
+    # write to a temporary file first, so the file is never left half-written
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+
+
+def log_write_error(future: Future) -> None:
+    exception = future.exception()
+    if exception is not None:
+        logger.warning(f"Failed to write notification history: {exception}")
@@ -1,9 +1,21 @@
+import functools
 from gi.repository import Gio  # type: ignore
 from .get_current_dir import get_current_dir
 
 DBUS_DIR = get_current_dir() + "/../dbus"
 
 
+# interfaces shipped with Ignis never change at runtime, so parse each one only once
+@functools.lru_cache(maxsize=64)
+def _load_bundled_interface(interface_name: str) -> Gio.DBusInterfaceInfo:
+    with open(f"{DBUS_DIR}/{interface_name}.xml") as file:
+        return _parse_interface(file.read())
+
+
+def _parse_interface(xml_string: str) -> Gio.DBusInterfaceInfo:
+    return Gio.DBusNodeInfo.new_for_xml(xml_string).interfaces[0]
+
+
 def load_interface_xml(
     interface_name: str | None = None, path: str | None = None, xml: str | None = None
 ) -> Gio.DBusInterfaceInfo:
@@ -25,9 +37,7 @@ def load_interface_xml(
     xml_string: str
 
     if interface_name:
-        file_path = f"{DBUS_DIR}/{interface_name}.xml"
-        with open(file_path) as file:
-            xml_string = file.read()
+        return _load_bundled_interface(interface_name)
     elif path:
         with open(path) as file:
             xml_string = file.read()
@@ -38,4 +48,4 @@ def load_interface_xml(
             "load_interface_xml() requires at least one positional argument"
         )
 
-    return Gio.DBusNodeInfo.new_for_xml(xml_string).interfaces[0]
+    return _parse_interface(xml_string)
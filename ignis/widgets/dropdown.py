@@ -40,11 +40,7 @@ class DropDown(Gtk.DropDown, BaseWidget):
     @items.setter
     def items(self, value: list[str]) -> None:
         self._items = value
-        model = Gtk.StringList()
-        for i in value:
-            model.append(i)
-
-        self.model = model
+        self.model = Gtk.StringList.new(list(value))
 
     @GObject.Property
     def on_selected(self) -> Callable | None:
@@ -31,8 +31,9 @@ class FileFilter(Gtk.FileFilter, IgnisGObject):
         self._mime_types = mime_types
         IgnisGObject.__init__(self, **kwargs)
 
+        add_mime_type = self.add_mime_type
         for i in mime_types:
-            self.add_mime_type(i)
+            add_mime_type(i)
 
     @GObject.Property
     def mime_types(self) -> list[str]:
@@ -70,6 +70,7 @@ pkgs.stdenv.mkDerivation {
         pkgs.python312Packages.requests
         pkgs.python312Packages.click
         pkgs.python312Packages.charset-normalizer
+        pkgs.python312Packages.orjson
       ])}:$out/lib/python3.12/site-packages:$PYTHONPATH" \
       --set GI_TYPELIB_PATH "$out/lib:${concatStringsSep ":" (map (pkg: "${pkg}/lib/girepository-1.0") [
         pkgs.glib